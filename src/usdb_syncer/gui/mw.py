@@ -190,7 +190,7 @@ class MainWindow(Ui_MainWindow, QMainWindow):
 
     def _populate_search_filters(self) -> None:
         for rating in RatingFilter:
-            self.comboBox_rating.addItem(str(rating), rating.value)
+            self.comboBox_rating.addItem(str(rating), rating)
         for golden in GoldenNotesFilter:
             self.comboBox_golden_notes.addItem(str(golden), golden.value)
         for views in ViewsFilter:
@@ -210,7 +210,10 @@ class MainWindow(Ui_MainWindow, QMainWindow):
                 )
             )
         self.comboBox_rating.currentIndexChanged.connect(
-            lambda: self.table.set_rating_filter(*self.comboBox_rating.currentData())
+            lambda: self.table.set_rating_filter(
+                self.comboBox_rating.currentData().rating,
+                self.comboBox_rating.currentData().exact,
+            )
         )
         self.comboBox_golden_notes.currentIndexChanged.connect(
             lambda: self.table.set_golden_notes_filter(
@@ -1,6 +1,12 @@
 """Proxy model for sorting and filtering data of a source model."""
 
+import sys
+from functools import reduce
+from operator import and_
+from typing import Any, Callable
+
 from PySide6.QtCore import (
+    QAbstractItemModel,
     QModelIndex,
     QObject,
     QPersistentModelIndex,
@@ -8,7 +14,7 @@ from PySide6.QtCore import (
     QTimer,
 )
 
-from usdb_syncer.gui.song_table.table_model import CustomRole
+from usdb_syncer.gui.song_table.table_model import TableModel, rows_in_mask
 from usdb_syncer.song_data import SongData, fuzz_text
 
 QIndex = QModelIndex | QPersistentModelIndex
@@ -26,16 +32,31 @@ class ListModel(QSortFilterProxyModel):
         self._golden_notes_filter: bool | None = None
         self._rating_filter = (0, False)
         self._views_filter = 0
+        # rows of the source model passing the current filters, computed in one pass
+        # over all songs instead of per-row round-trips through the source model
+        self._accepted_rows: set[int] | None = None
 
         self._filter_invalidation_timer = QTimer(parent)
         self._filter_invalidation_timer.setSingleShot(True)
         self._filter_invalidation_timer.setInterval(200)
         self._filter_invalidation_timer.timeout.connect(  # type:ignore
-            self.invalidateRowsFilter
+            self._invalidate_accepted_rows
         )
 
         super().__init__(parent)
 
+    def setSourceModel(self, sourceModel: QAbstractItemModel) -> None:
+        assert isinstance(sourceModel, TableModel)
+        # drop the cache before the proxy refilters changed data; connected first, so
+        # these are also called first
+        sourceModel.modelAboutToBeReset.connect(  # type:ignore
+            self._clear_accepted_rows
+        )
+        sourceModel.dataChanged.connect(  # type:ignore
+            lambda *_: self._clear_accepted_rows()
+        )
+        super().setSourceModel(sourceModel)
+
     def source_rows(self, subset: list[QModelIndex] | None = None) -> list[int]:
         """Returns the source rows of the provided or all rows in the model."""
         indices = subset or (self.index(row, 0) for row in range(self.rowCount()))
@@ -46,19 +67,20 @@ class ListModel(QSortFilterProxyModel):
         self._filter_invalidation_timer.start()
 
     def set_artist_filter(self, artist: str) -> None:
-        self._artist_filter = artist
+        # song strings are interned as well, so lookups compare by identity first
+        self._artist_filter = sys.intern(artist)
         self._filter_invalidation_timer.start()
 
     def set_title_filter(self, title: str) -> None:
-        self._title_filter = title
+        self._title_filter = sys.intern(title)
         self._filter_invalidation_timer.start()
 
     def set_language_filter(self, language: str) -> None:
-        self._language_filter = language
+        self._language_filter = sys.intern(language)
         self._filter_invalidation_timer.start()
 
     def set_edition_filter(self, edition: str) -> None:
-        self._edition_filter = edition
+        self._edition_filter = sys.intern(edition)
         self._filter_invalidation_timer.start()
 
     def set_golden_notes_filter(self, golden_notes: bool | None) -> None:
@@ -73,26 +95,81 @@ class ListModel(QSortFilterProxyModel):
         self._views_filter = min_views
         self._filter_invalidation_timer.start()
 
-    def filterAcceptsRow(self, source_row: int, source_parent: QIndex) -> bool:
+    def _clear_accepted_rows(self) -> None:
+        self._accepted_rows = None
+
+    def _invalidate_accepted_rows(self) -> None:
+        self._accepted_rows = None
+        self.invalidateRowsFilter()
+
+    def _compute_accepted_rows(self) -> set[int]:
         model = self.sourceModel()
-        idx = model.index(source_row, 0, source_parent)
-        song: SongData = model.data(idx, CustomRole.ALL_DATA)
-        if self._artist_filter not in ("", song.data.artist):
-            return False
-        if self._title_filter not in ("", song.data.title):
-            return False
-        if self._language_filter not in ("", song.data.language):
-            return False
-        if self._edition_filter not in ("", song.data.edition):
-            return False
-        if self._golden_notes_filter not in (None, song.data.golden_notes):
-            return False
-        if (
-            song.data.rating < self._rating_filter[0]
-            or self._rating_filter[1]
-            and song.data.rating > self._rating_filter[0]
-        ):
-            return False
-        if song.data.views < self._views_filter:
-            return False
-        return all(word in song.fuzzy_text for word in self._text_filter)
+        assert isinstance(model, TableModel)
+        masks = [
+            index.get(value, 0)
+            for index, value in (
+                (model.artist_to_rows, self._artist_filter),
+                (model.title_to_rows, self._title_filter),
+                (model.language_to_rows, self._language_filter),
+                (model.edition_to_rows, self._edition_filter),
+            )
+            if value
+        ]
+        conditions: list[str] = []
+        namespace: dict[str, Any] = {}
+        self._apply_views_and_rating_filters(model, masks, conditions, namespace)
+        if self._golden_notes_filter is not None:
+            conditions.append("song.data.golden_notes is golden_notes")
+            namespace["golden_notes"] = self._golden_notes_filter
+        if self._text_filter:
+            conditions.append("all(word in song.fuzzy_text for word in words)")
+            namespace["words"] = self._text_filter
+        accepts = _compile_predicate(conditions, namespace)
+        if masks:
+            rows = rows_in_mask(reduce(and_, masks))
+            if accepts is None:
+                return set(rows)
+            return {row for row in rows if accepts(model.songs[row])}
+        if accepts is None:
+            return set(range(len(model.songs)))
+        return {row for row, song in enumerate(model.songs) if accepts(song)}
+
+    def _apply_views_and_rating_filters(
+        self,
+        model: TableModel,
+        masks: list[int],
+        conditions: list[str],
+        namespace: dict[str, Any],
+    ) -> None:
+        """Adds the views and rating filters as precomputed masks if possible,
+        otherwise as per-song conditions."""
+        if self._views_filter > 0:
+            if (mask := model.rows_with_min_views(self._views_filter)) is not None:
+                masks.append(mask)
+            else:
+                conditions.append("song.data.views >= min_views")
+                namespace["min_views"] = self._views_filter
+        rating, exact = self._rating_filter
+        if rating > 0 or exact:
+            if (mask := model.rows_with_rating(rating, exact)) is not None:
+                masks.append(mask)
+            else:
+                conditions.append(f"song.data.rating {'==' if exact else '>='} rating")
+                namespace["rating"] = rating
+
+    def filterAcceptsRow(self, source_row: int, _source_parent: QIndex) -> bool:
+        if self._accepted_rows is None:
+            self._accepted_rows = self._compute_accepted_rows()
+        return source_row in self._accepted_rows
+
+
+def _compile_predicate(
+    conditions: list[str], namespace: dict[str, Any]
+) -> Callable[[SongData], bool] | None:
+    """Compiles the conditions into one specialized function closing over the
+    namespace, or None if there is nothing left to check per song."""
+    if not conditions:
+        return None
+    source = f"def accepts(song):\n    return {' and '.join(conditions)}\n"
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["accepts"]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Iterable, Iterator
 
@@ -150,10 +150,8 @@ class SongTable:
     def _process_rows(
         self, rows: Iterable[int], processor: Callable[[SongData], bool]
     ) -> None:
-        for row in rows:
-            data = self._model.songs[row]
-            if processor(data):
-                self._model.row_changed(row)
+        if changed := [row for row in rows if processor(self._model.songs[row])]:
+            self._model.rows_changed(changed)
 
     def stage_selection(self) -> None:
         self._stage_rows(self._list_rows(selected_only=True))
@@ -196,7 +194,12 @@ class SongTable:
         model.setSortRole(CustomRole.SORT)
         view.setModel(model)
         view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        view.customContextMenuRequested.connect(lambda _: self._context_menu(menu))  # type: ignore
+        # built once; rebuilding the menu on every right-click is needless work
+        context_menu = QMenu(view)
+        context_menu.addActions(menu.actions())
+        view.customContextMenuRequested.connect(  # type: ignore
+            lambda _: context_menu.exec(QCursor.pos())
+        )
         view.doubleClicked.connect(lambda idx: self._on_double_clicked(idx, model))  # type: ignore
         header = view.horizontalHeader()
         if not state.isEmpty():
@@ -214,12 +217,6 @@ class SongTable:
                 header.resizeSection(column, DEFAULT_COLUMN_WIDTH)
                 header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
 
-    def _context_menu(self, base_menu: QMenu) -> None:
-        menu = QMenu()
-        for action in base_menu.actions():
-            menu.addAction(action)
-        menu.exec(QCursor.pos())
-
     def _on_double_clicked(
         self, index: QModelIndex, model: QSortFilterProxyModel
     ) -> None:
@@ -300,14 +297,11 @@ class SongTable:
         )
 
     def stage_local_songs(self, directory: Path) -> None:
-        song_map: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
-        for row, song in enumerate(self._model.songs):
-            song_map[fuzzy_key(song.data)].append(row)
         matched_rows: set[int] = set()
-        for path in directory.glob("**/*.txt"):
-            if txt := try_parse_txt(path):
-                name = txt.headers.artist_title_str()
-                if matches := song_map[fuzzy_key(txt.headers)]:
+        for headers in _try_parse_txt_headers(list(directory.rglob("*.txt"))):
+            if headers:
+                name = headers.artist_title_str()
+                if matches := self._model.rows_for_fuzzy_key(fuzzy_key(headers)):
                     plural = "es" if len(matches) > 1 else ""
                     _logger.info(f"{len(matches)} match{plural} for '{name}'.")
                     matched_rows.update(matches)
@@ -378,7 +372,7 @@ class SongTable:
         self._model.set_data(songs)
 
     def get_all_data(self) -> tuple[SongData, ...]:
-        return self._model.songs
+        return tuple(self._model.songs)
 
     def all_local_songs(self) -> Iterator[UsdbSong]:
         return self._model.all_local_songs()
@@ -390,11 +384,29 @@ class SongTable:
         self._model.update_item(new)
 
 
-def fuzzy_key(data: UsdbSong | Headers) -> tuple[str, str]:
-    return fuzz_text(data.artist), fuzz_text(data.title)
+def fuzzy_key(headers: Headers) -> tuple[str, str]:
+    return fuzz_text(headers.artist), fuzz_text(headers.title)
+
 
+# more than enough for the header block; avoids decoding the whole file
+_MAX_HEADERS_LENGTH = 4096
 
-def try_parse_txt(path: Path) -> SongTxt | None:
-    if contents := try_read_unknown_encoding(path):
-        return SongTxt.try_parse(contents, _err_logger)
+
+def try_parse_txt_headers(path: Path) -> Headers | None:
+    if contents := try_read_unknown_encoding(path, max_length=_MAX_HEADERS_LENGTH):
+        return SongTxt.try_parse_headers(contents, _err_logger)
     return None
+
+
+# for few files, the overhead of a thread pool is not worth it
+_MIN_PARALLEL_PARSE_COUNT = 32
+
+
+def _try_parse_txt_headers(paths: list[Path]) -> Iterable[Headers | None]:
+    """Parses the files' headers, concurrently if there are enough of them to be worth
+    it. Results are in input order either way.
+    """
+    if len(paths) < _MIN_PARALLEL_PARSE_COUNT:
+        return map(try_parse_txt_headers, paths)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(try_parse_txt_headers, paths))
@@ -1,7 +1,9 @@
 """Table model for song data."""
 
+from collections import defaultdict
 from enum import Enum
 from functools import cache
+from itertools import groupby
 from typing import Any, Iterable, Iterator, assert_never
 
 from PySide6.QtCore import (
@@ -31,25 +33,90 @@ class CustomRole(int, Enum):
 class TableModel(QAbstractTableModel):
     """Table model for song data."""
 
-    songs: tuple[SongData, ...] = tuple()
+    songs: list[SongData]
     rows: dict[SongId, int]
+    # row sets are stored as int bitmasks with bit n set for row n, so combining
+    # filters is a C-speed bitwise operation
+    artist_to_rows: dict[str, int]
+    title_to_rows: dict[str, int]
+    language_to_rows: dict[str, int]
+    edition_to_rows: dict[str, int]
+    _rating_rows: list[int]
+    _min_rating_rows: list[int]
+    _min_views_rows: list[int]
+    # song ids rather than rows, so removals don't invalidate the index
+    _fuzzy_index: dict[tuple[str, str], set[SongId]]
 
     def __init__(self, parent: QObject) -> None:
+        self.songs = []
         self.rows = {}
+        self.artist_to_rows = {}
+        self.title_to_rows = {}
+        self.language_to_rows = {}
+        self.edition_to_rows = {}
+        self._rating_rows = [0] * 6
+        self._min_rating_rows = [0] * 6
+        self._min_views_rows = [0] * 6
+        self._fuzzy_index = defaultdict(set)
         super().__init__(parent)
 
-    def set_data(self, songs: tuple[SongData, ...]) -> None:
+    def set_data(self, songs: Iterable[SongData]) -> None:
         self.beginResetModel()
-        self.songs = songs
-        self.rows = {song.data.song_id: idx for idx, song in enumerate(songs)}
+        self.songs = list(songs)
+        self.rows = {song.data.song_id: idx for idx, song in enumerate(self.songs)}
+        self._build_row_indices()
         self.endResetModel()
 
+    def _build_row_indices(self) -> None:
+        """Map filterable attributes to bitmasks of the rows of matching songs."""
+        self.artist_to_rows = defaultdict(int)
+        self.title_to_rows = defaultdict(int)
+        self.language_to_rows = defaultdict(int)
+        self.edition_to_rows = defaultdict(int)
+        views_buckets = [0] * 6
+        rating_buckets = [0] * 6
+        self._fuzzy_index = defaultdict(set)
+        for row, song in enumerate(self.songs):
+            bit = 1 << row
+            self.artist_to_rows[song.data.artist] |= bit
+            self.title_to_rows[song.data.title] |= bit
+            self.language_to_rows[song.data.language] |= bit
+            self.edition_to_rows[song.data.edition] |= bit
+            views_buckets[min(song.data.views // 100, 5)] |= bit
+            # the song list cache is user-writable, so don't trust the rating range
+            rating_buckets[min(max(song.data.rating, 0), 5)] |= bit
+            self._fuzzy_index[song.fuzzy_key()].add(song.data.song_id)
+        self._rating_rows = rating_buckets
+        self._min_views_rows = _suffix_unions(views_buckets)
+        self._min_rating_rows = _suffix_unions(rating_buckets)
+
+    def rows_with_min_views(self, min_views: int) -> int | None:
+        """Precomputed bitmask of rows with at least `min_views` views, or None if the
+        threshold is not a bucket boundary."""
+        if min_views % 100 == 0 and 0 <= min_views <= 500:
+            return self._min_views_rows[min_views // 100]
+        return None
+
+    def rows_for_fuzzy_key(self, key: tuple[str, str]) -> list[int]:
+        """Rows of songs whose fuzzed artist and title match the key."""
+        return [self.rows[song_id] for song_id in self._fuzzy_index.get(key, ())]
+
+    def rows_with_rating(self, rating: int, exact: bool) -> int | None:
+        """Precomputed bitmask of rows with the given (minimum) rating, or None if the
+        rating is out of range."""
+        if not 0 <= rating <= 5:
+            return None
+        return self._rating_rows[rating] if exact else self._min_rating_rows[rating]
+
     def update_item(self, new: SongData) -> None:
         idx = self.rows[new.data.song_id]
-        self.songs = self.songs[:idx] + (new,) + self.songs[idx + 1 :]
-        start_idx = self.index(idx, 0)
-        end_idx = self.index(idx, self.columnCount())
-        self.dataChanged.emit(start_idx, end_idx)  # type:ignore
+        old = self.songs[idx]
+        self.songs[idx] = new
+        if old.data != new.data:
+            # a finished download may carry re-scraped meta data, so all indices
+            # derived from it have to be refreshed
+            self._build_row_indices()
+        self.row_changed(idx)
 
     def remove_row(self, row: int) -> None:
         self.set_data(self.songs[:row] + self.songs[row + 1 :])
@@ -83,6 +150,14 @@ class TableModel(QAbstractTableModel):
         end_idx = self.index(row, self.columnCount() - 1)
         self.dataChanged.emit(start_idx, end_idx)  # type:ignore
 
+    def rows_changed(self, rows: Iterable[int]) -> None:
+        """Emits one dataChanged signal per contiguous run of rows."""
+        last_column = self.columnCount() - 1
+        for first, last in _contiguous_runs(sorted(rows)):
+            start_idx = self.index(first, 0)
+            end_idx = self.index(last, last_column)
+            self.dataChanged.emit(start_idx, end_idx)  # type:ignore
+
     ### QAbstractTableModel implementation
 
     def columnCount(self, parent: QIndex = QModelIndex()) -> int:
@@ -119,6 +194,31 @@ class TableModel(QAbstractTableModel):
         return None
 
 
+def _contiguous_runs(rows: list[int]) -> Iterator[tuple[int, int]]:
+    """Yields (first, last) pairs for runs of consecutive values in sorted input."""
+    for _, run in groupby(enumerate(rows), key=lambda pair: pair[1] - pair[0]):
+        items = list(run)
+        yield items[0][1], items[-1][1]
+
+
+def _suffix_unions(buckets: list[int]) -> list[int]:
+    """For each index, the union of the bucket masks at that index and above."""
+    unions: list[int] = []
+    acc = 0
+    for bucket in reversed(buckets):
+        acc |= bucket
+        unions.append(acc)
+    return unions[::-1]
+
+
+def rows_in_mask(mask: int) -> Iterator[int]:
+    """Yields the rows corresponding to the set bits of the mask."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
 def _display_data(song: SongData, column: int) -> str | None:
     col = Column(column)
     match col:
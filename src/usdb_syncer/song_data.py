@@ -5,9 +5,9 @@ plus information about locally existing files.
 from __future__ import annotations
 
 import enum
+import re
 from enum import Enum
 from pathlib import Path
-from typing import assert_never
 
 import attrs
 from unidecode import unidecode
@@ -20,6 +20,8 @@ from usdb_syncer.usdb_scraper import UsdbSong
 class FuzzySearchText:
     """Song data for robust searching."""
 
+    __slots__ = ("song_id", "artist", "title", "language", "edition")
+
     def __init__(self, song: UsdbSong) -> None:
         self.song_id = str(song.song_id)
         self.artist = fuzz_text(song.artist)
@@ -54,12 +56,16 @@ REPLACEMENTS = (
     ("/", ""),
 )
 
+# one compiled scan over the text instead of one .replace() pass per variation;
+# alternatives are tried in order, so longer variants keep taking precedence
+_REPLACEMENT_PATTERN = re.compile("|".join(re.escape(old) for old, _ in REPLACEMENTS))
+_REPLACEMENT_MAP = dict(REPLACEMENTS)
+
 
 def fuzz_text(text: str) -> str:
-    text = unidecode(text).lower()
-    for old, new in REPLACEMENTS:
-        text = text.replace(old, new)
-    return text
+    return _REPLACEMENT_PATTERN.sub(
+        lambda match: _REPLACEMENT_MAP[match[0]], unidecode(text).lower()
+    )
 
 
 class DownloadErrorReason(Enum):
@@ -112,34 +118,34 @@ class DownloadStatus(Enum):
     DONE = 4
     FAILED = 5
 
-    def __str__(self) -> str:  # pylint: disable=invalid-str-returned
-        match self:
-            case DownloadStatus.NONE | DownloadStatus.STAGED:
-                return ""
-            case DownloadStatus.PENDING:
-                return "Pending"
-            case DownloadStatus.DOWNLOADING:
-                return "Downloading"
-            case DownloadStatus.DONE:
-                return "Done"
-            case DownloadStatus.FAILED:
-                return "Failed"
-            case _ as unreachable:
-                assert_never(unreachable)
+    def __str__(self) -> str:
+        return _DOWNLOAD_STATUS_NAMES[self]
 
     def can_be_unstaged(self) -> bool:
-        return self in (
-            DownloadStatus.STAGED,
-            DownloadStatus.DONE,
-            DownloadStatus.FAILED,
-        )
+        return self in _UNSTAGEABLE_STATUSES
 
     def can_be_downloaded(self) -> bool:
-        return self in (
-            DownloadStatus.NONE,
-            DownloadStatus.STAGED,
-            DownloadStatus.FAILED,
-        )
+        return self in _DOWNLOADABLE_STATUSES
+
+
+# checked once per row in bulk operations, so built once instead of per call
+_UNSTAGEABLE_STATUSES = frozenset(
+    (DownloadStatus.STAGED, DownloadStatus.DONE, DownloadStatus.FAILED)
+)
+_DOWNLOADABLE_STATUSES = frozenset(
+    (DownloadStatus.NONE, DownloadStatus.STAGED, DownloadStatus.FAILED)
+)
+
+
+# looked up in __str__, which is called on every repaint of a status cell
+_DOWNLOAD_STATUS_NAMES = {
+    DownloadStatus.NONE: "",
+    DownloadStatus.STAGED: "",
+    DownloadStatus.PENDING: "Pending",
+    DownloadStatus.DOWNLOADING: "Downloading",
+    DownloadStatus.DONE: "Done",
+    DownloadStatus.FAILED: "Failed",
+}
 
 
 @attrs.define
@@ -164,3 +170,7 @@ class SongData:
 
     def with_local_files(self, local_files: LocalFiles) -> SongData:
         return SongData(self.data, self.fuzzy_text, local_files, self.status)
+
+    def fuzzy_key(self) -> tuple[str, str]:
+        """Fuzzed artist and title for matching with local songs."""
+        return self.fuzzy_text.artist, self.fuzzy_text.title
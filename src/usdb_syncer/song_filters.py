@@ -16,12 +16,20 @@ class RatingFilter(Enum):
     MIN_3 = (3, False)
     MIN_4 = (4, False)
 
+    def __init__(self, rating: int, exact: bool) -> None:
+        self.rating = rating
+        self.exact = exact
+
     def __str__(self) -> str:
-        if self == RatingFilter.ANY:
-            return "Any"
-        if self.value[1]:
-            return self.value[0] * "★"
-        return self.value[0] * "★" + " or more"
+        return _RATING_FILTER_NAMES[self]
+
+
+_RATING_FILTER_NAMES = {
+    f: "Any"
+    if f is RatingFilter.ANY
+    else f.rating * "★" + ("" if f.exact else " or more")
+    for f in RatingFilter
+}
 
 
 class GoldenNotesFilter(Enum):
@@ -32,11 +40,14 @@ class GoldenNotesFilter(Enum):
     NO = False
 
     def __str__(self) -> str:
-        if self == GoldenNotesFilter.ANY:
-            return "Any"
-        if self == GoldenNotesFilter.YES:
-            return "Yes"
-        return "No"
+        return _GOLDEN_NOTES_FILTER_NAMES[self]
+
+
+_GOLDEN_NOTES_FILTER_NAMES = {
+    GoldenNotesFilter.ANY: "Any",
+    GoldenNotesFilter.YES: "Yes",
+    GoldenNotesFilter.NO: "No",
+}
 
 
 class ViewsFilter(Enum):
@@ -50,6 +61,9 @@ class ViewsFilter(Enum):
     MIN_500 = 500
 
     def __str__(self) -> str:
-        if self == ViewsFilter.ANY:
-            return "Any"
-        return f"{self.value}+"
+        return _VIEWS_FILTER_NAMES[self]
+
+
+_VIEWS_FILTER_NAMES = {
+    f: "Any" if f is ViewsFilter.ANY else f"{f.value}+" for f in ViewsFilter
+}
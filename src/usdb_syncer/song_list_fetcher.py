@@ -58,7 +58,7 @@ def load_cached_songs() -> list[UsdbSong] | None:
         return None
     with path.open(encoding="utf8") as file:
         try:
-            return json.load(file, object_hook=UsdbSong.from_json)
+            return [UsdbSong.from_json(song) for song in json.load(file)]
         except (json.decoder.JSONDecodeError, TypeError, KeyError):
             return None
 
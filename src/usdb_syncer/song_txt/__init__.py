@@ -60,6 +60,22 @@ class SongTxt:
         except NotesParseError:
             return None
 
+    @classmethod
+    def try_parse_headers(cls, value: str, logger: Log) -> Headers | None:
+        """Parses the headers only, without parsing the notes making up the bulk of
+        the file."""
+        header_lines = []
+        for line in value.splitlines():
+            if not line:
+                continue
+            if not line.startswith("#"):
+                break
+            header_lines.append(line)
+        try:
+            return Headers.parse(header_lines, logger)
+        except NotesParseError:
+            return None
+
     def maybe_split_duet_notes(self) -> None:
         if self.headers.relative and self.headers.relative.lower() == "yes":
             return
@@ -9,7 +9,7 @@ from typing import Iterator, Type, assert_never
 
 import attrs
 import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 from requests import Session
 
 from usdb_syncer import SongId, settings
@@ -146,6 +146,8 @@ class RequestMethod(Enum):
 class CommentContents:
     """The parsed contents of a SongComment."""
 
+    __slots__ = ("text", "youtube_ids", "urls")
+
     text: str
     youtube_ids: list[str]
     urls: list[str]
@@ -159,6 +161,8 @@ class CommentContents:
 class SongComment:
     """A comment to a song on USDB."""
 
+    __slots__ = ("date_time", "author", "contents")
+
     date_time: datetime
     author: str
     contents: CommentContents
@@ -345,24 +349,28 @@ def get_usdb_available_songs(
             payload=payload,
             session=session,
         )
-        songs = list(
-            UsdbSong.from_html(
-                _usdb_strings_from_html(html),
-                song_id=match[1],
-                artist=match[2],
-                title=match[3],
-                edition=match[4],
-                golden_notes=match[5],
-                language=match[6],
-                rating=match[7],
-                views=match[8],
-            )
+        matches = [
+            match
             for match in SONG_LIST_ROW_REGEX.finditer(html)
             if SongId.parse(match[1]) > max_skip_id
-        )
-        available_songs.extend(songs)
+        ]
+        if matches:
+            usdb_strings = _usdb_strings_from_html(html)
+            available_songs.extend(
+                UsdbSong.from_html(
+                    song_id=match[1],
+                    artist=match[2],
+                    title=match[3],
+                    edition=match[4],
+                    golden_notes=match[5] == usdb_strings.YES,
+                    language=match[6],
+                    rating=match[7].count("star.png"),
+                    views=match[8],
+                )
+                for match in matches
+            )
 
-        if len(songs) < Usdb.MAX_SONGS_PER_PAGE:
+        if len(matches) < Usdb.MAX_SONGS_PER_PAGE:
             break
 
     _logger.info(f"Fetched {len(available_songs)} new song(s) from USDB.")
@@ -507,7 +515,9 @@ def get_notes(song_id: SongId, logger: Log) -> str:
         params={"link": "gettxt", "id": str(int(song_id))},
         payload={"wd": "1"},
     )
-    return _parse_song_txt_from_txt_page(BeautifulSoup(html, "lxml"))
+    # only the textarea is of interest, so skip building a tree for the rest
+    soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer("textarea"))
+    return _parse_song_txt_from_txt_page(soup)
 
 
 def _parse_song_txt_from_txt_page(soup: BeautifulSoup) -> str:
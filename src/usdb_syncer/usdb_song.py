@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from json import JSONEncoder
-from typing import Any, Type
+from typing import Any
 
 import attrs
 
 from usdb_syncer import SongId
-from usdb_syncer.constants import UsdbStrings
 
 
 @attrs.frozen(auto_attribs=True, kw_only=True)
@@ -27,38 +27,45 @@ class UsdbSong:
     @classmethod
     def from_json(cls, dct: dict[str, Any]) -> UsdbSong:
         dct["song_id"] = SongId(dct["song_id"])
+        # these repeat a lot; interning deduplicates them and makes comparisons in the
+        # filter path effectively pointer comparisons
+        for key in ("artist", "title", "language", "edition"):
+            dct[key] = sys.intern(dct[key])
         return cls(**dct)
 
     @classmethod
     def from_html(
         cls,
-        strings: Type[UsdbStrings],
         *,
         song_id: str,
         artist: str,
         title: str,
         language: str,
         edition: str,
-        golden_notes: str,
-        rating: str,
+        golden_notes: bool,
+        rating: int,
         views: str,
     ) -> UsdbSong:
         return cls(
             song_id=SongId.parse(song_id),
-            artist=artist,
-            title=title,
-            language=language,
-            edition=edition,
-            golden_notes=golden_notes == strings.YES,
-            rating=rating.count("star.png"),
+            artist=sys.intern(artist),
+            title=sys.intern(title),
+            language=sys.intern(language),
+            edition=sys.intern(edition),
+            golden_notes=golden_notes,
+            rating=rating,
             views=int(views),
         )
 
 
+# resolved once so serializing does not introspect attrs metadata per song
+_USDB_SONG_FIELDS = tuple(field.name for field in attrs.fields(UsdbSong))
+
+
 class UsdbSongEncoder(JSONEncoder):
     """Custom JSON encoder"""
 
     def default(self, o: Any) -> Any:
         if isinstance(o, UsdbSong):
-            return attrs.asdict(o, recurse=False)
+            return {name: getattr(o, name) for name in _USDB_SONG_FIELDS}
         return super().default(o)
@@ -90,11 +90,13 @@ def extract_youtube_id(url: str) -> str | None:
     return None
 
 
-def try_read_unknown_encoding(path: Path) -> str | None:
+def try_read_unknown_encoding(path: Path, max_length: int | None = None) -> str | None:
+    """Reads the file, trying several encodings. At most `max_length` characters are
+    read if given."""
     for codec in ["utf-8-sig", "cp1252"]:
         try:
             with open(path, encoding=codec) as file:
-                return file.read()
+                return file.read(max_length)
         except UnicodeDecodeError:
             pass
     return None
@@ -18,6 +18,17 @@ def test_notes_parser_normalized(resource_dir: str) -> None:
         assert str(txt) == contents, f"failed test for '{path}'"
 
 
+def test_headers_only_parser(resource_dir: str) -> None:
+    folder = os.path.join(resource_dir, "txt", "normalized")
+    for path in glob(f"{folder}/*.txt"):
+        with open(path, encoding="utf-8") as file:
+            contents = file.read()
+        txt = SongTxt.try_parse(contents, _logger)
+        headers = SongTxt.try_parse_headers(contents, _logger)
+        assert txt is not None and headers is not None, f"failed test for '{path}'"
+        assert headers == txt.headers, f"failed test for '{path}'"
+
+
 def test_notes_parser_deviant(resource_dir: str) -> None:
     folder = os.path.join(resource_dir, "txt", "deviant")
     for path in glob(f"{folder}/*_in.txt"):
@@ -0,0 +1,15 @@
+"""Tests for functions from the song_data module."""
+
+from usdb_syncer.song_data import fuzz_text
+
+
+def test_fuzz_text() -> None:
+    assert fuzz_text("Mötley Crüe") == "motley crue"
+    assert fuzz_text("A & B") == "a and b"
+    assert fuzz_text("A&B") == "a and b"
+    assert fuzz_text("Me + You") == "me and you"
+    assert fuzz_text("A ft. B") == "a feat. b"
+    assert fuzz_text("A ft B") == "a feat. b"
+    assert fuzz_text("A feat B") == "a feat. b"
+    assert fuzz_text("Hello!?/") == "hello"
+    assert fuzz_text("X vs. Y") == "x vs  y"